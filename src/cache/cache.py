@@ -1,6 +1,6 @@
 import math
 import warnings
-from typing import List, NamedTuple, Optional
+from typing import Iterable, List, NamedTuple, Optional
 
 from cache.bus_interface import bus_operation, put_snoop_result
 from cache.cache_set import CacheLine, CacheSetPLRUMESI
@@ -303,6 +303,37 @@ class Cache:
             return CacheLine(tag=line.tag, mesi_state=line.mesi_state)
         return None
 
+    def lookup_state(self, address: int) -> MESIState:
+        """
+        Look up the MESI state of the line for an address, without modifying cache state or statistics.
+        Cheaper than lookup_line() when only the state is needed, as no copy of the line is made.
+        Args:
+            address: Memory address to check
+        Returns:
+            MESIState: State of the cached line, MESIState.INVALID if not cached
+        """
+        addr_fields = self.__decompose_address(address)
+
+        cache_set = self.sets[addr_fields.index]
+        if cache_set is None:
+            return MESIState.INVALID
+
+        way_index = cache_set.search_set(addr_fields.tag, update_plru=False)
+        if way_index is None:
+            return MESIState.INVALID
+        return cache_set.ways[way_index].mesi_state
+
+    def lookup_states(self, addresses: Iterable[int]) -> List[MESIState]:
+        """
+        Look up the MESI states of the lines for several addresses in one call, without modifying
+        cache state or statistics. Equivalent to calling lookup_state() for each address.
+        Args:
+            addresses: Memory addresses to check
+        Returns:
+            List[MESIState]: State of each cached line, MESIState.INVALID if not cached
+        """
+        return [self.lookup_state(address) for address in addresses]
+
     def __create_set(self) -> CacheSetPLRUMESI:
         """
         Internal method to create a new cache set dynamically
@@ -315,6 +346,14 @@ class Cache:
         """
         self.sets = [None] * self.num_sets
 
+    def reset(self):
+        """
+        Restore the cache to its freshly constructed state, clearing all cache contents
+        and statistics. Allows one instance to be reused, e.g. across test cases.
+        """
+        self.clear_cache()
+        self.statistics = Statistics()
+
     def print_cache(self):
         """Print cache contents of only valid lines using the logger, this is in response to trace command 9"""
         header_printed = False
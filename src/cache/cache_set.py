@@ -156,6 +156,11 @@ class CacheSetPLRUMESI:
         # Initialize cache lines
         self.ways = [CacheLine() for _ in range(num_ways)]
 
+        # Map of tag to the way it was last allocated in, so searches are a dict
+        # lookup rather than a scan of every way. Lines invalidated in place keep
+        # their entry, so the line state must still be checked on a hit.
+        self.tag_index: dict[int, int] = {}
+
         # Initialize PLRU state - only need (num_ways - 1) bits for tree
         self.state = 0
 
@@ -250,12 +255,25 @@ class CacheSetPLRUMESI:
         Returns:
             Way index if found, None if not found
         """
-        for way_index, line in enumerate(self.ways):
-            if not line.is_invalid() and line.tag == tag:
-                if update_plru:
-                    self.__update_plru(way_index)
-                return way_index
-        return None  # Cache Miss
+        way_index = self.tag_index.get(tag)
+        if way_index is None or self.ways[way_index].is_invalid():
+            return None  # Cache Miss
+        if update_plru:
+            self.__update_plru(way_index)
+        return way_index
+
+    def __index_tag(self, line: CacheLine, way_index: int, tag: int) -> None:
+        """
+        Update the tag index for a new tag stored in a way, dropping the entry
+        for the tag previously stored there.
+            Args:
+                line: Cache line in the way being allocated
+                way_index: Index of the way being allocated
+                tag: New tag stored in the way
+        """
+        if self.tag_index.get(line.tag) == way_index:
+            del self.tag_index[line.tag]
+        self.tag_index[tag] = way_index
 
     def allocate(
         self, tag: int, state: MESIState = MESIState.EXCLUSIVE
@@ -278,6 +296,7 @@ class CacheSetPLRUMESI:
         for way_index, line in enumerate(self.ways):
             if line.is_invalid():
                 # Found an invalid line, use it
+                self.__index_tag(line, way_index, tag)
                 line.tag = tag
                 line.mesi_state = state
                 self.__update_plru(way_index)
@@ -291,6 +310,7 @@ class CacheSetPLRUMESI:
             mesi_state=victim_line.mesi_state,
         )
         # Set up new line
+        self.__index_tag(victim_line, victim_way, tag)
         victim_line.tag = tag
         victim_line.mesi_state = state
         # Update PLRU based on new line access
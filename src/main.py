@@ -42,7 +42,10 @@ def main():
                 addr_str = f"0x{addr:08x}" if addr is not None else "No Address"
                 logger.log(
                     LogLevel.DEBUG,
-                    f"\nOperation: {op.value} {op.name:20} Address: {addr_str}",
+                    "\nOperation: %d %-20s Address: %s",
+                    op.value,
+                    op.name,
+                    addr_str,
                 )
                 handle_event(cache, op.value, addr)
 
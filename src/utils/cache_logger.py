@@ -36,20 +36,28 @@ class CacheLogger:
         self.stdout = stdout
         self.stderr = stderr
 
-    def log(self, level: LogLevel, message: str):
+    def log(self, level: LogLevel, message: str, *args):
         """
         Log message if level is sufficient
 
         Args:
             level (LogLevel): Logging level of the message
-            message (str): Message string
+            message (str): Message string, or a %-style format string if args are given
+            *args: Optional values to format into message. Formatting is deferred until
+                the level check passes, so messages below the logger level cost nothing
+                to build.
         Note:
             - Silent level messages go to stdout
             - Normal and Debug level messages go to stderr
         """
         if self.level >= level:
+            if args:
+                message = message % args
             stream = self.stdout if level == LogLevel.SILENT else self.stderr
-            print(f"{message}", file=stream, flush=True)
+            # Single write of the message and newline, equivalent to print() with
+            # flush=True, which writes the message and newline separately
+            stream.write(f"{message}\n")
+            stream.flush()
 
 
 def log_operation(logger: CacheLogger):
@@ -121,7 +129,10 @@ def log_operation(logger: CacheLogger):
             # Debug level logging
             logger.log(
                 LogLevel.DEBUG,
-                f"Entering {op_name} with args={args[1:]} kwargs={kwargs}",
+                "Entering %s with args=%s kwargs=%s",
+                op_name,
+                args[1:],
+                kwargs,
             )
 
             # Execute operation
@@ -167,7 +178,7 @@ def log_operation(logger: CacheLogger):
                     pass
 
             # Debug level: exit logging
-            logger.log(LogLevel.DEBUG, f"Exiting {op_name} with result: {result}")
+            logger.log(LogLevel.DEBUG, "Exiting %s with result: %s", op_name, result)
 
             return result
 
@@ -1,10 +1,29 @@
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 from cache.cache import Cache
 from common.constants import BusOp, LogLevel
 from config.project_config import config
 
 
+def _l1_request_action(
+    cache: type[Cache], event_opcode: int
+) -> Optional[Callable[[int], None]]:
+    """
+    Returns the cache method that handles an L1 request opcode, or None if the
+    opcode is not an L1 request. Shared by handle_event() and handle_events().
+    """
+    match event_opcode:
+        # 0 and 2: read requests from L1 data and instruction caches
+        case 0 | 2:
+            return cache.pr_read
+
+        # 1: write request from L1 data cache
+        case 1:
+            return cache.pr_write
+
+    return None
+
+
 def handle_event(
     cache: type[Cache], event_opcode: int, addr: Optional[int] = None
 ) -> None:
@@ -19,20 +38,14 @@ def handle_event(
     """
     logger = config.get_logger()
 
+    # 0-2: read and write requests from L1
+    action = _l1_request_action(cache, event_opcode)
+    if action is not None:
+        action(addr)
+        return
+
     # Match on the event_opcode
     match event_opcode:
-        # 0: read request from L1 data cache
-        case 0:
-            cache.pr_read(addr)
-
-        # 1: write request from L1 data cache
-        case 1:
-            cache.pr_write(addr)
-
-        # 2: read request from L1 instruction cache
-        case 2:
-            cache.pr_read(addr)
-
         # 3: snooped read request
         case 3:
             cache.handle_snoop(BusOp.READ, addr)
@@ -57,4 +70,32 @@ def handle_event(
 
         # Default case (if opcode does not match any known command)
         case _:
-            logger.log(LogLevel.DEBUG, f"Unknown opcode: {event_opcode}")
+            logger.log(LogLevel.DEBUG, "Unknown opcode: %s", event_opcode)
+
+
+def handle_events(
+    cache: type[Cache],
+    event_opcode: int,
+    addrs: Iterable[int],
+) -> None:
+    """
+    Processes the same cache event for each address in a sequence.
+
+    For L1 requests the cache method is resolved once up front, rather than
+    re-dispatching on the opcode for every address as repeated calls to
+    handle_event() would. Other opcodes are passed to handle_event().
+
+    Parameters:
+        cache: A Cache instance on which to perform the specified action.
+        event_opcode (int): An integer (0-9) representing the cache event type.
+        addrs (Iterable[int]): Target addresses in the cache, processed in order
+
+    """
+    action = _l1_request_action(cache, event_opcode)
+    if action is None:
+        for addr in addrs:
+            handle_event(cache, event_opcode, addr)
+        return
+
+    for addr in addrs:
+        action(addr)
@@ -32,6 +32,10 @@ class Statistics:
         total = self.cache_hits + self.cache_misses
         return self.cache_hits / total if total > 0 else 0
 
+    def as_tuple(self) -> tuple[int, int, int, int]:
+        """Return the counts as (cache_reads, cache_writes, cache_hits, cache_misses)"""
+        return (self.cache_reads, self.cache_writes, self.cache_hits, self.cache_misses)
+
     def record_read(self):
         """Record a cache read operation"""
         self.cache_reads += 1
@@ -7,26 +7,31 @@ from cache.cache_set import CacheLine
 from cache.l1_interface import L1Interface
 from common.constants import MESIState, CacheMessage
 from config.cache_config import CacheConfig
+from utils.statistics import Statistics
 
 
 class TestCache(unittest.TestCase):
     """Test basic functionality of cache, line lookup, and statistics tracking"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Load the configuration once, as it reads the .env file, and no test
+        # modifies it
+        cls.cache_config = CacheConfig()
+
     def setUp(self):
         """Create a cache instance with test configuration"""
-        cache_config = CacheConfig()
         # Mocking the config logger and args for testing
         self.mock_logger = MagicMock()
         self.mock_args = MagicMock(silent=False, debug=True)
 
-        self.cache = Cache(cache_config, self.mock_logger)
+        self.cache = Cache(self.cache_config, self.mock_logger)
 
         # Patch the config logger and args
-        patch(
-            "config.project_config.config.get_logger", return_value=self.mock_logger
-        ).start()
-        patch(
-            "config.project_config.config.get_args", return_value=self.mock_args
+        patch.multiple(
+            "config.project_config.config",
+            get_logger=MagicMock(return_value=self.mock_logger),
+            get_args=MagicMock(return_value=self.mock_args),
         ).start()
 
         # TODO: Consider how to mock these instead
@@ -131,6 +136,37 @@ class TestCache(unittest.TestCase):
         self.assertIsNotNone(line)
         self.assertEqual(line.mesi_state, MESIState.MODIFIED)
 
+    def test_lookup_state(self):
+        """Test line state lookup functionality"""
+        addr = 0x1234_5678
+
+        # Initially line shouldn't be present
+        self.assertEqual(self.cache.lookup_state(addr), MESIState.INVALID)
+
+        # Write miss allocates the line in Modified state
+        self.cache.pr_write(addr)
+        self.assertEqual(self.cache.lookup_state(addr), MESIState.MODIFIED)
+
+        # Same set, different tag is still not present
+        self.assertEqual(self.cache.lookup_state(addr ^ (1 << 31)), MESIState.INVALID)
+
+    def test_lookup_states(self):
+        """Test bulk line state lookup functionality"""
+        addrs = [0x1234_5678, 0x2234_5678, 0x1234_5640]
+
+        # Initially no lines should be present
+        self.assertEqual(self.cache.lookup_states(addrs), [MESIState.INVALID] * 3)
+
+        # Read miss to the first line, write miss to the last
+        self.cache.pr_read(addrs[0])
+        self.cache.pr_write(addrs[2])
+        self.assertEqual(
+            self.cache.lookup_states(addrs),
+            [self.cache.lookup_state(addr) for addr in addrs],
+        )
+        self.assertEqual(self.cache.lookup_states(addrs)[1], MESIState.INVALID)
+        self.assertEqual(self.cache.lookup_states(addrs)[2], MESIState.MODIFIED)
+
     def test_cache_line_fill(self):
         """Test cache line fill operations"""
         addr = 0x1234_5678
@@ -206,6 +242,19 @@ class TestCache(unittest.TestCase):
         for addr in addresses:
             self.assertIsNone(self.cache.lookup_line(addr))
 
+    def test_reset(self):
+        """Test resetting the cache contents and statistics"""
+        addresses = [0x1000, 0x2000, 0x3000]
+        for addr in addresses:
+            self.cache.pr_read(addr)
+
+        self.cache.reset()
+
+        # Verify all lines are gone and statistics are cleared
+        for addr in addresses:
+            self.assertIsNone(self.cache.lookup_line(addr))
+        self.assertEqual(self.cache.statistics, Statistics())
+
     def test_print_cache(self):
         """Test printing calls our cache logger"""
         # Generate 10 random addresses (ensuring they don't overlap)
@@ -64,6 +64,27 @@ class TestCacheSet(unittest.TestCase):
         # Search miss on different tag
         self.assertIsNone(self.cache_set.search_set(0x5678))
 
+    def test_search_after_invalidate_and_evict(self):
+        """Test search misses on invalidated and evicted tags, and hits on reallocated ones"""
+        cache_set = CacheSetPLRUMESI(num_ways=2)
+        _, way_a = cache_set.allocate(0xA, MESIState.EXCLUSIVE)
+        cache_set.allocate(0xB, MESIState.SHARED)
+
+        # Invalidated line keeps its tag, but should no longer hit
+        cache_set.mesi_state[way_a] = MESIState.INVALID
+        self.assertIsNone(cache_set.search_set(0xA))
+
+        # Refilling the invalid way with a new tag drops the old tag
+        _, way_c = cache_set.allocate(0xC, MESIState.EXCLUSIVE)
+        self.assertEqual(way_c, way_a)
+        self.assertEqual(cache_set.search_set(0xC), way_c)
+        self.assertIsNone(cache_set.search_set(0xA))
+
+        # Evicting a line drops its tag
+        victim_line, way_d = cache_set.allocate(0xD, MESIState.EXCLUSIVE)
+        self.assertEqual(cache_set.search_set(0xD), way_d)
+        self.assertIsNone(cache_set.search_set(victim_line.tag))
+
     def test_allocation_with_mesi(self):
         """Test cache line allocation with different MESI states"""
         # Allocate first line as EXCLUSIVE
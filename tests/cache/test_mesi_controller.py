@@ -21,12 +21,10 @@ class TestMESIProtocol(unittest.TestCase):
         self.mock_args = MagicMock(silent=False, debug=True)
 
         # Patch config to prevent real logger usage
-        patch(
-            "config.project_config.config.get_logger", return_value=self.mock_logger
-        ).start()
-
-        patch(
-            "config.project_config.config.get_args", return_value=self.mock_args
+        patch.multiple(
+            "config.project_config.config",
+            get_logger=MagicMock(return_value=self.mock_logger),
+            get_args=MagicMock(return_value=self.mock_args),
         ).start()
 
         # Initialize both singletons, TODO: consider using mocking here too
@@ -1,12 +1,81 @@
 import re
 import unittest
-from unittest.mock import MagicMock, patch, call
-from callee import Regex
+from collections import Counter
+from contextlib import contextmanager
+from enum import IntEnum
+from unittest.mock import MagicMock, patch
 from cache.cache import Cache
 from config.cache_config import CacheConfig
 from cache.bus_interface import BusInterface
 from cache.l1_interface import L1Interface
-from common.constants import LogLevel, MESIState
+from common.constants import BusOp, CacheMessage, LogLevel, SnoopResult
+from utils.event_handler import handle_event
+
+# Single pattern to classify log messages from the bus and L1 interfaces by the
+# operation they report. The group name is the enum class of the operation.
+LOG_CLASSIFIER = re.compile(
+    r"L2: (?P<CacheMessage>\d+)"
+    r"|BusOp: (?P<BusOp>\d+)"
+    r"|SnoopResult: Address \w+, SnoopResult: (?P<SnoopResult>\d+)"
+)
+LOG_CATEGORIES = {cls.__name__: cls for cls in (BusOp, CacheMessage, SnoopResult)}
+
+
+class LogSpy:
+    """
+    Minimal stand-in for CacheLogger that tallies log calls for assertions.
+    Used instead of a MagicMock, which builds call objects and child mocks for
+    every call. Bus and L1 messages are classified and counted by level and
+    operation as they are logged.
+    """
+
+    __slots__ = ("counts", "enabled")
+
+    def __init__(self):
+        self.counts = Counter()
+        self.enabled = True
+
+    def log(self, level: LogLevel, message: str, *args):
+        """Tally a log call, with the same signature as CacheLogger.log()"""
+        if not self.enabled:
+            return
+        # Classify the formatted message, so lazily formatted log calls are tallied too
+        match = LOG_CLASSIFIER.match(message % args if args else message)
+        if match is not None:
+            category = LOG_CATEGORIES[match.lastgroup]
+            operation = category(int(match.group(match.lastgroup)))
+            # Key on the enum class too, since e.g. BusOp.READ == CacheMessage.GETLINE
+            self.counts[(level, category, operation)] += 1
+
+    def count_operation(self, level: LogLevel, operation: IntEnum) -> int:
+        """
+        Return the number of messages at a log level that reported an operation.
+        Only the operation enums in LOG_CATEGORIES are tallied, so members of any
+        other enum are rejected rather than always counting zero.
+        """
+        category = type(operation)
+        if LOG_CATEGORIES.get(category.__name__) is not category:
+            raise TypeError(
+                f"Log messages are not tallied by {category.__name__}, expected one of: "
+                f"{', '.join(LOG_CATEGORIES)}"
+            )
+        return self.counts[(level, category, operation)]
+
+    @contextmanager
+    def pause(self):
+        """
+        Context manager that drops log calls instead of tallying them, for setup
+        events whose log messages are not part of any assertion
+        """
+        self.enabled = False
+        try:
+            yield
+        finally:
+            self.enabled = True
+
+    def reset(self):
+        """Discard the tallies of all log calls so far"""
+        self.counts.clear()
 
 
 class IntegrationSetup(unittest.TestCase):
@@ -26,33 +95,37 @@ class IntegrationSetup(unittest.TestCase):
     """
 
     # Define class attributes with possible addresses for each snoop result
-    # These will serve as fixtures for tests in child classes
-    hit_addresses = [0x10000000, 0x20000004, 0x30000008, 0x4000000C]  # LSBs 00
-    hitm_addresses = [0x10000001, 0x20000005, 0x30000009, 0x4000000D]  # LSBs 01
-    nohit_addresses = [0x10000002, 0x20000006, 0x3000000A, 0x4000000F]  # LSBs 10 or 11
+    # These will serve as fixtures for tests in child classes, and are tuples
+    # so they are built once and can't be modified by any one test
+    hit_addresses = (0x10000000, 0x20000004, 0x30000008, 0x4000000C)  # LSBs 00
+    hitm_addresses = (0x10000001, 0x20000005, 0x30000009, 0x4000000D)  # LSBs 01
+    nohit_addresses = (0x10000002, 0x20000006, 0x3000000A, 0x4000000F)  # LSBs 10 or 11
 
     # Addresses to fill a single 16-way set with lines in the exclusive state
     # assumes 14-bit set index and 6-bit byte offset, resulting in shift of 20 bits
-    single_set_addresses = [0x00000002 + (i * (1 << 20)) for i in range(16)]
+    single_set_addresses = tuple(0x00000002 + (i * (1 << 20)) for i in range(16))
+
+    # Addresses with NOHIT responses in set 0, starting from tag 1: the first 16 fill
+    # the set, and the 17th has a new tag that triggers an eviction
+    eviction_addresses = tuple(0x00000002 + (i * (1 << 20)) for i in range(1, 18))
 
     # Generate one address per set (total 2^14 sets)
     # assumes 64 byte cache line size
-    all_sets_single_address = [0x00000002 + (i * 64) for i in range(1 << 14)]
+    all_sets_single_address = tuple(0x00000002 + (i * 64) for i in range(1 << 14))
 
     # Setup resources for all tests in the class
     @classmethod
     def setUpClass(cls):
         # Initialize cache configuration and mocks
         cls.cache_config = CacheConfig()
-        cls.mock_logger = MagicMock()
+        cls.mock_logger = LogSpy()
         cls.mock_args = MagicMock(silent=False, debug=True)
 
         # Patch the config logger and args
-        patch(
-            "config.project_config.config.get_logger", return_value=cls.mock_logger
-        ).start()
-        patch(
-            "config.project_config.config.get_args", return_value=cls.mock_args
+        patch.multiple(
+            "config.project_config.config",
+            get_logger=MagicMock(return_value=cls.mock_logger),
+            get_args=MagicMock(return_value=cls.mock_args),
         ).start()
 
         # Need to ensure we're using new singleton instances
@@ -62,77 +135,151 @@ class IntegrationSetup(unittest.TestCase):
         BusInterface.initialize(cls.mock_logger)
         L1Interface.initialize(cls.mock_logger)
 
+        # Create a single cache instance shared by all tests in the class,
+        # which is reset before each test rather than reconstructed
+        cls.cache = Cache(cls.cache_config, cls.mock_logger)
+
     # Cleanup after all tests in the class
     @classmethod
     def tearDownClass(cls):
         patch.stopall()
 
     def setUp(self):
-        # Set up a new cache instance for each test using the
-        # mocked logger that's shared across all tests
-        self.cache = Cache(self.cache_config, self.mock_logger)
+        # Start each test with an empty cache and fresh statistics
+        self.cache.reset()
 
     # Teardown that needs to happen after *each* test is run
     def tearDown(self):
-        self.mock_logger.reset_mock()
+        self.mock_logger.reset()
 
     # Helper function to check MESI state
+    # A line that is not in the cache is reported in the Invalid state
     def check_line_state(self, addr, expected_state):
-        line = self.cache.lookup_line(addr)
-        if expected_state == MESIState.INVALID:
-            self.assertIsNone(line, f"Unexpected line at address {hex(addr)} in cache.")
-        else:
-            self.assertIsNotNone(
-                line, f"Line at address {hex(addr)} not found in cache."
-            )
+        # Compare first, so the failure message is only formatted on a mismatch
+        actual_state = self.cache.lookup_state(addr)
+        if actual_state != expected_state:
             self.assertEqual(
-                line.mesi_state,
+                actual_state,
                 expected_state,
-                f"Unexpected MESI state at address {hex(addr)}.",
+                f"Unexpected MESI state at address {addr:#x}.",
+            )
+
+    # Helper function to dispatch a single event and check the resulting MESI state
+    # of the line it touched, for the common handle_event() + check_line_state() pair
+    def handle_and_check(self, event_opcode, addr, expected_state):
+        handle_event(self.cache, event_opcode, addr)
+        self.check_line_state(addr, expected_state)
+
+    # Helper function to dispatch a sequence of events, checking the line state
+    # after each one, for tests that run the same steps with different events
+    def run_script(self, script, ops):
+        """
+        Args:
+            script: (operation, address, expected state) steps, where address is
+                    "nohit", "hit", or "hitm" for the snoop response it results in.
+            ops: Mapping from each operation named in the script to its trace event.
+        """
+        handle_and_check = self.handle_and_check
+        addrs = {
+            "nohit": self.nohit_addresses[0],
+            "hit": self.hit_addresses[0],
+            "hitm": self.hitm_addresses[0],
+        }
+
+        for op, addr_key, expected_state in script:
+            handle_and_check(ops[op], addrs[addr_key], expected_state)
+
+    # Helper function to start a subtest from a clean slate, since subtests
+    # share their test's fixture rather than running setUp() and tearDown()
+    def reset_subtest(self):
+        self.cache.reset()
+        self.mock_logger.reset()
+
+    # Helper function to check that a group of lines all share a MESI state,
+    # using a single comparison rather than one assertion per line.
+    # On failure, the list diff gives the position of each mismatched address.
+    def check_line_states(self, addrs, expected_state):
+        actual_states = self.cache.lookup_states(addrs)
+        expected_states = [expected_state] * len(addrs)
+        if actual_states != expected_states:
+            self.assertEqual(
+                actual_states,
+                expected_states,
+                f"Unexpected MESI states for addresses {addrs}.",
             )
 
     def assert_log_called_with_count(
-        self, log_level: LogLevel, pattern: str, expected_count: int
+        self,
+        log_level: LogLevel,
+        operation: IntEnum,
+        expected_count: int,
     ):
         """
-        Asserts that mock_logger.log is called a specified number of times with a specific log level
-        and a message matching the regex pattern.
+        Asserts that mock_logger.log was called a specified number of times with a specific log level
+        and a message reporting an operation, checked against the counts tallied as messages were logged.
 
         Args:
             log_level: The expected log level (e.g., LogLevel.NORMAL).
-            pattern: A raw string to use as a regex pattern to match in the log message.
+            operation: A BusOp, CacheMessage, or SnoopResult member.
             expected_count: The number of times the log call should occur with the specified log level
-                            and message matching the pattern.
+                            and operation.
 
         Raises:
             AssertionError: If the log call with the specified arguments is not found the expected number of times.
+            TypeError: If the operation is a member of an enum other than BusOp, CacheMessage, or SnoopResult.
+        """
+        count = self.mock_logger.count_operation(log_level, operation)
+        if count != expected_count:
+            raise AssertionError(
+                f"Expected log call with level {log_level} and operation {operation!r} to be called "
+                f"exactly {expected_count} times, but found {count} matching calls."
+            )
+
+    def assert_log_counts(
+        self,
+        log_level: LogLevel,
+        *operation_counts: tuple[IntEnum, int],
+    ):
         """
-        # Extract 'log' calls only
-        log_calls = [c for c in self.mock_logger.mock_calls if c[0] == "log"]
+        Asserts the number of log calls at a log level reporting each of several operations,
+        checked against the counts tallied as messages were logged.
 
-        # Define the expected call with regex for the second argument
-        expected_call = call.log(log_level, Regex(pattern, flags=re.IGNORECASE))
+        Args:
+            log_level: The expected log level (e.g., LogLevel.NORMAL).
+            operation_counts: (operation, expected_count) pairs, where each operation is a BusOp,
+                              CacheMessage, or SnoopResult member. Pairs are used rather than a
+                              dict, since members of different operation enums with the same
+                              value compare equal (e.g. BusOp.READ == CacheMessage.GETLINE).
 
-        # Count occurrences of the expected call
-        matching_calls = [c for c in log_calls if expected_call == c]
+        Raises:
+            AssertionError: If any operation is not logged the expected number of times.
+            TypeError: If an operation is a member of any other enum.
+        """
+        count_operation = self.mock_logger.count_operation
+        actual_counts = [
+            (operation, count_operation(log_level, operation))
+            for operation, _ in operation_counts
+        ]
 
-        # Assert the correct number of matching calls
-        if len(matching_calls) != expected_count:
-            raise AssertionError(
-                f"Expected log call with level {log_level} and pattern '{pattern}' to be called exactly "
-                f"{expected_count} times, but found {len(matching_calls)} matching calls."
+        # Compare all counts at once, so a failure reports every mismatch
+        if actual_counts != list(operation_counts):
+            self.assertEqual(
+                actual_counts,
+                list(operation_counts),
+                f"Unexpected log call counts at level {log_level}.",
             )
 
-    def assert_log_called_once_with(self, log_level: LogLevel, pattern: str):
+    def assert_log_called_once_with(self, log_level: LogLevel, operation: IntEnum):
         """
-        Asserts that mock_logger.log is called exactly once with a specific log level
-        and a message matching the regex pattern.
+        Asserts that mock_logger.log was called exactly once with a specific log level
+        and a message reporting an operation.
 
         Args:
             log_level: The expected log level (e.g., LogLevel.NORMAL).
-            pattern: A raw string to use as a regex pattern to match in the log message.
+            operation: A BusOp, CacheMessage, or SnoopResult member. See
+                       assert_log_called_with_count().
 
         Raises:
             AssertionError: If the log call with the specified arguments is not found exactly once.
         """
-        self.assert_log_called_with_count(log_level, pattern, expected_count=1)
+        self.assert_log_called_with_count(log_level, operation, expected_count=1)
@@ -1,5 +1,5 @@
 import unittest
-from common.constants import MESIState, LogLevel, TraceCommand
+from common.constants import MESIState, TraceCommand
 from utils.event_handler import handle_event
 from tests.integration.integration_setup import IntegrationSetup
 
@@ -27,18 +27,23 @@ class TestClearCache(IntegrationSetup):
         - Clear cache
         - Confirm those lines are not present
         """
+        # Bind enum members to locals once, rather than on every iteration
+        read = TraceCommand.L1_DATA_READ
+        exclusive = MESIState.EXCLUSIVE
+        invalid = MESIState.INVALID
+
         # Fill the cache set
         for addr in self.single_set_addresses:
-            handle_event(self.cache, TraceCommand.L1_DATA_READ, addr)
+            handle_event(self.cache, read, addr)
             # Confirm the lines were allocated
-            self.check_line_state(addr, MESIState.EXCLUSIVE)
+            self.check_line_state(addr, exclusive)
 
         # Clear the cache
         self.cache.clear_cache()
 
         # Confirm lines are no longer valid in the cache
         for addr in self.single_set_addresses:
-            self.check_line_state(addr, MESIState.INVALID)
+            self.check_line_state(addr, invalid)
 
     def test_all_sets(self):
         """
@@ -49,18 +54,23 @@ class TestClearCache(IntegrationSetup):
         - Clear cache
         - Confirm those lines are not present
         """
+        # Bind enum members to locals once, rather than on every iteration
+        read = TraceCommand.L1_DATA_READ
+        exclusive = MESIState.EXCLUSIVE
+        invalid = MESIState.INVALID
+
         # Fill all cache sets
         for addr in self.all_sets_single_address:
-            handle_event(self.cache, TraceCommand.L1_DATA_READ, addr)
+            handle_event(self.cache, read, addr)
             # Confirm the lines were allocated
-            self.check_line_state(addr, MESIState.EXCLUSIVE)
+            self.check_line_state(addr, exclusive)
 
         # Clear the cache
         self.cache.clear_cache()
 
         # Confirm lines are no longer valid in the cache
         for addr in self.all_sets_single_address:
-            self.check_line_state(addr, MESIState.INVALID)
+            self.check_line_state(addr, invalid)
 
 
 # Allow direct execution of this file
@@ -1,19 +1,32 @@
-import re
 import unittest
-from callee import Regex
-from common.constants import MESIState, LogLevel, TraceCommand
-from utils.event_handler import handle_event
+from common.constants import BusOp, CacheMessage, LogLevel, MESIState, TraceCommand
+from utils.event_handler import handle_event, handle_events
 from tests.integration.integration_setup import IntegrationSetup
 
 
 class TestCommandL1ReadRequestData(IntegrationSetup):
 
+    # Event scripts for run_script(), as (operation, address, expected state) steps
+    _EXCLUSIVE_SCRIPT = (
+        ("read", "nohit", MESIState.EXCLUSIVE),  # Read miss (gets line in E state)
+        ("read", "nohit", MESIState.EXCLUSIVE),  # Read hit (should stay in E state)
+    )
+    _MODIFIED_SCRIPT = (
+        ("read", "nohit", MESIState.EXCLUSIVE),  # Read miss (gets line in E state)
+        ("write", "nohit", MESIState.MODIFIED),  # Write hit (line moves to M state)
+        ("read", "nohit", MESIState.MODIFIED),  # Read hit (should stay in M state)
+    )
+    _SHARED_SCRIPT = (
+        ("read", "hit", MESIState.SHARED),  # Read miss (gets line in S state)
+        ("read", "hit", MESIState.SHARED),  # Read hit (should stay in S state)
+    )
+
     def setUp(self):
         super().setUp()
-        # Default to 0 for trace event op code.
+        # Default to the L1 data read trace event.
         # This allows us to create a child class for the instruction read requests,
         # which should have identical behavior.
-        self.trace_event = 0
+        self.trace_event = TraceCommand.L1_DATA_READ
         # nohit_addr is an address that results in a simulated
         # NOHIT snoop response from other caches
         self.nohit_addr = self.nohit_addresses[0]
@@ -24,57 +37,43 @@ class TestCommandL1ReadRequestData(IntegrationSetup):
         # HITM snoop response from other caches
         self.hitm_addr = self.hitm_addresses[0]
 
-    def test_exclusive(self):
+    # Trace events for the operations named in the event scripts
+    @property
+    def script_ops(self):
+        return {"read": self.trace_event, "write": TraceCommand.L1_DATA_WRITE}
+
+    def test_clean_states(self):
         """
-        Test reading a line in the Exclusive state.
-        Other caches return a NOHIT snoop response.
+        Test reading a line in a clean state, run as one subtest per state:
+        - Exclusive: other caches return a NOHIT snoop response.
+        - Shared: other caches return a HIT snoop response.
 
         Requires the following sequence:
         - Read line (cache miss)
         - Read line (cache hit)
         """
-        # Increment expected stats values based on actions we expect to
-        # modify the cache statistics object
-        # Note: these values are not determined by the actual return value
-        # of the functions being called
-        expected_reads = 0
-        expected_writes = 0
-        expected_hits = 0
-        expected_misses = 0
-
-        # Event 0: Read miss at self.nohit_addr (gets line in E state)
-        handle_event(self.cache, self.trace_event, self.nohit_addr)
-
-        # Confirm the L2 sendline message was issued
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"l2: (sendline|2).*")
+        for state, script in (
+            (MESIState.EXCLUSIVE, self._EXCLUSIVE_SCRIPT),
+            (MESIState.SHARED, self._SHARED_SCRIPT),
+        ):
+            with self.subTest(state=state.name):
+                self.reset_subtest()
 
-        # Check that a bus operation was issued, once per read event
-        # with either the name (read) or the operation ID number
-        self.mock_logger.log.assert_any_call(
-            LogLevel.NORMAL,
-            Regex(r".*busop.*(read|1).*", flags=re.IGNORECASE),
-        )
+                self.run_script(script, self.script_ops)
 
-        expected_misses += 1
-        expected_reads += 1
-        self.check_line_state(self.nohit_addr, MESIState.EXCLUSIVE)
+                # Confirm the L2 sendline message was issued for each L1 request
+                self.assert_log_called_with_count(
+                    LogLevel.NORMAL, CacheMessage.SENDLINE, 2
+                )
 
-        # Event 0: Read hit at self.nohit_addr (should stay in E state)
-        handle_event(self.cache, self.trace_event, self.nohit_addr)
-        expected_hits += 1
-        expected_reads += 1
-        self.check_line_state(self.nohit_addr, MESIState.EXCLUSIVE)
+                # The second read event should not generate a bus operation,
+                # because it was a hit to a clean line. So we'll test that there's
+                # only been 1 of these bus operations issued in total.
+                self.assert_log_called_once_with(LogLevel.NORMAL, BusOp.READ)
 
-        # The second read event should not generate a bus operation, because
-        # it was a hit to an exclusive line. So we'll test that there's only
-        # been 1 of these bus operations issued in total.
-        self.assert_log_called_once_with(LogLevel.NORMAL, r".*busop.*(read|1).*")
-
-        # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, expected_reads)
-        self.assertEqual(self.cache.statistics.cache_writes, expected_writes)
-        self.assertEqual(self.cache.statistics.cache_hits, expected_hits)
-        self.assertEqual(self.cache.statistics.cache_misses, expected_misses)
+                # Assertions for statistics
+                # (reads, writes, hits, misses)
+                self.assertEqual(self.cache.statistics.as_tuple(), (2, 0, 1, 1))
 
     def test_modified(self):
         """
@@ -86,63 +85,18 @@ class TestCommandL1ReadRequestData(IntegrationSetup):
         - Write line (cache hit)
         - Read line (cache hit)
         """
-        # Event 0: Read miss at self.nohit_addr (gets line in E state)
-        handle_event(self.cache, self.trace_event, self.nohit_addr)
-        self.check_line_state(self.nohit_addr, MESIState.EXCLUSIVE)
-
-        # Event 1: Write hit at self.nohit_addr (line moves to M state)
-        handle_event(self.cache, 1, self.nohit_addr)
-        self.check_line_state(self.nohit_addr, MESIState.MODIFIED)
-
-        # Event 0: Read hit at self.nohit_addr (should stay in M state)
-        handle_event(self.cache, self.trace_event, self.nohit_addr)
-        self.check_line_state(self.nohit_addr, MESIState.MODIFIED)
+        self.run_script(self._MODIFIED_SCRIPT, self.script_ops)
 
         # Confirm the L2 sendline message was issued for each L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 3)
+        self.assert_log_called_with_count(LogLevel.NORMAL, CacheMessage.SENDLINE, 3)
 
         # Only the first read request should have resulted in a READ
         # bus operation.
-        self.assert_log_called_once_with(LogLevel.NORMAL, r".*busop.*(read|1).*")
+        self.assert_log_called_once_with(LogLevel.NORMAL, BusOp.READ)
 
         # Assertions for statistics
-        # As an alternative to the above that accumulates the expected
-        # stats values, we can hardcode them here, which may be more
-        # readable.
-        self.assertEqual(self.cache.statistics.cache_reads, 2)
-        self.assertEqual(self.cache.statistics.cache_writes, 1)
-        self.assertEqual(self.cache.statistics.cache_hits, 2)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
-
-    def test_shared(self):
-        """
-        Test reading a line in the Shared state.
-        Other caches return a HIT snoop response.
-
-        Requires the following sequence:
-        - Read line (cache miss)
-        - Read line (cache hit)
-        """
-        # Event 0: Read miss at self.hit_addr (gets line in S state)
-        handle_event(self.cache, self.trace_event, self.hit_addr)
-        self.check_line_state(self.hit_addr, MESIState.SHARED)
-
-        # Event 0: Read hit at self.hit_addr (should stay in S state)
-        handle_event(self.cache, self.trace_event, self.hit_addr)
-        self.check_line_state(self.hit_addr, MESIState.SHARED)
-
-        # Confirm the L2 sendline message was issued for each L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 2)
-
-        # Only the first read request should have resulted in a READ
-        # bus operation.
-        self.assert_log_called_once_with(LogLevel.NORMAL, r".*busop.*(read|1).*")
-
-        # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 2)
-        self.assertEqual(self.cache.statistics.cache_writes, 0)
-        self.assertEqual(self.cache.statistics.cache_hits, 1)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (2, 1, 2, 1))
 
     def test_hitm(self):
         """
@@ -155,20 +109,17 @@ class TestCommandL1ReadRequestData(IntegrationSetup):
         # Event 0: Read miss at self.hitm_addr (gets line in S state)
         # Assumes cache with the modified line flushes the line
         # (with write-back) and our cache snarfs it
-        handle_event(self.cache, self.trace_event, self.hitm_addr)
-        self.check_line_state(self.hitm_addr, MESIState.SHARED)
+        self.handle_and_check(self.trace_event, self.hitm_addr, MESIState.SHARED)
 
         # Confirm the L2 sendline message was issued
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"l2: (sendline|2).*")
+        self.assert_log_called_once_with(LogLevel.NORMAL, CacheMessage.SENDLINE)
 
         # Check for a single READ bus operation
-        self.assert_log_called_once_with(LogLevel.NORMAL, r".*busop.*(read|1).*")
+        self.assert_log_called_once_with(LogLevel.NORMAL, BusOp.READ)
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 1)
-        self.assertEqual(self.cache.statistics.cache_writes, 0)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (1, 0, 0, 1))
 
     def test_clean_eviction(self):
         """
@@ -179,33 +130,25 @@ class TestCommandL1ReadRequestData(IntegrationSetup):
         - Read lines to fill the cache (cache misses)
         - Read line to cause an eviction (cache miss)
         """
-        # Base addr that returns a NOHIT snoop response from other caches
-        address = 0x00000002  # Start with set 0, offset with NOHIT response
-        increment = 0x100000  # 1 MiB increment to change the tag
-
         # Fill the cache
-        for _i in range(16):
-            address += increment
-            handle_event(self.cache, self.trace_event, address)
-            self.check_line_state(address, MESIState.EXCLUSIVE)
+        handle_events(self.cache, self.trace_event, self.eviction_addresses[:16])
+        self.check_line_states(self.eviction_addresses[:16], MESIState.EXCLUSIVE)
 
         # One more read to trigger an eviction of a clean line
-        handle_event(self.cache, self.trace_event, address + increment)
-
-        # Confirm the L2 sendline message was issued for each L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 17)
+        handle_event(self.cache, self.trace_event, self.eviction_addresses[16])
 
-        # Check for one READ bus operation per cache miss
-        self.assert_log_called_with_count(LogLevel.NORMAL, r".*busop.*(read|1).*", 17)
-
-        # Confirm the L2 message to L1 for evictline was issued
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (evictline|4).*", 1)
+        # Confirm the L2 sendline message was issued for each L1 request,
+        # one READ bus operation per cache miss, and the L2 message to L1 for evictline
+        self.assert_log_counts(
+            LogLevel.NORMAL,
+            (CacheMessage.SENDLINE, 17),
+            (BusOp.READ, 17),
+            (CacheMessage.EVICTLINE, 1),
+        )
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 17)
-        self.assertEqual(self.cache.statistics.cache_writes, 0)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 17)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (17, 0, 0, 17))
 
     def test_dirty_eviction(self):
         """
@@ -216,50 +159,42 @@ class TestCommandL1ReadRequestData(IntegrationSetup):
         - Write lines to fill the cache (cache misses)
         - Read line to cause an eviction (cache miss)
         """
-        # Base addr that returns a NOHIT snoop response from other caches
-        address = 0x00000002  # Start with set 0, offset with NOHIT response
-        increment = 0x100000  # 1 MiB increment to change the tag
-
         # Fill the cache
-        for _i in range(16):
-            address += increment
-            handle_event(self.cache, 1, address)
-            self.check_line_state(address, MESIState.MODIFIED)
+        handle_events(
+            self.cache, TraceCommand.L1_DATA_WRITE, self.eviction_addresses[:16]
+        )
+        self.check_line_states(self.eviction_addresses[:16], MESIState.MODIFIED)
 
         # One more read to trigger an eviction of a dirty line
-        handle_event(self.cache, self.trace_event, address + increment)
-
-        # Confirm the L2 sendline message was issued for each L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 17)
+        handle_event(self.cache, self.trace_event, self.eviction_addresses[16])
 
-        # Check for one RWIM bus operation per cache miss
-        self.assert_log_called_with_count(LogLevel.NORMAL, r".*busop.*(rwim|4).*", 16)
-
-        # Confirm bus op for read request was issued
-        self.assert_log_called_with_count(
-            LogLevel.NORMAL, r".*busop.*(read|1).*address", 1
+        # Confirm the L2 sendline message was issued for each L1 request, one RWIM
+        # bus operation per write miss, one READ for the read request, and the
+        # L2 messages to L1 for eviction
+        self.assert_log_counts(
+            LogLevel.NORMAL,
+            (CacheMessage.SENDLINE, 17),
+            (BusOp.RWIM, 16),
+            (BusOp.READ, 1),
+            (CacheMessage.GETLINE, 1),
+            (CacheMessage.EVICTLINE, 1),
         )
 
-        # Confirm the L2 messages to L1 for eviction were issued
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (getline|1).*", 1)
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (evictline|4).*", 1)
-
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 1)
-        self.assertEqual(self.cache.statistics.cache_writes, 16)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 17)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (1, 16, 0, 17))
 
     def test_read_all_in_set(self):
+        # Bind fixtures to locals, rather than looking them up on every read
+        cache, trace_event = self.cache, TraceCommand.L1_DATA_READ
+
         # Read all tags in the set
         for address in range(0x00000000, 0xFFF00001, 0x00100000):
-            handle_event(self.cache, TraceCommand.L1_DATA_READ, address)
+            handle_event(cache, trace_event, address)
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 1 << 12)
-        self.assertEqual(self.cache.statistics.cache_writes, 0)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 1 << 12)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (1 << 12, 0, 0, 1 << 12))
 
 
 # In order to test events 0 and 2, we need to create a child class for
@@ -278,7 +213,7 @@ class TestCommandL1ReadRequestInstruction(TestCommandL1ReadRequestData):
 
     def setUp(self):
         super().setUp()
-        self.trace_event = 2
+        self.trace_event = TraceCommand.L1_INST_READ
 
 
 # Allow direct execution of this file
@@ -1,11 +1,21 @@
 import unittest
-from common.constants import MESIState, LogLevel, TraceCommand
-from utils.event_handler import handle_event
+from common.constants import BusOp, CacheMessage, LogLevel, MESIState, TraceCommand
+from utils.event_handler import handle_event, handle_events
 from tests.integration.integration_setup import IntegrationSetup
 
 
 class TestCommandL1WriteRequest(IntegrationSetup):
 
+    # Event scripts for run_script(), as (operation, address, expected state) steps
+    _EXCLUSIVE_SCRIPT = (
+        ("read", "nohit", MESIState.EXCLUSIVE),  # Read miss (gets line in E state)
+        ("write", "nohit", MESIState.MODIFIED),  # Write hit (line moves to M state)
+    )
+    _SHARED_SCRIPT = (
+        ("read", "hit", MESIState.SHARED),  # Read miss (gets line in S state)
+        ("write", "hit", MESIState.MODIFIED),  # Write hit (line moves to M state)
+    )
+
     def setUp(self):
         super().setUp()
         self.trace_event = TraceCommand.L1_DATA_WRITE
@@ -19,37 +29,43 @@ class TestCommandL1WriteRequest(IntegrationSetup):
         # HITM snoop response from other caches
         self.hitm_addr = self.hitm_addresses[0]
 
-    def test_exclusive(self):
+    # Trace events for the operations named in the event scripts
+    @property
+    def script_ops(self):
+        return {"read": TraceCommand.L1_DATA_READ, "write": self.trace_event}
+
+    def test_clean_states(self):
         """
-        Test writing a line in the Exclusive state.
-        Other caches return a NOHIT snoop response.
+        Test writing a line in a clean state, run as one subtest per state:
+        - Exclusive: other caches return a NOHIT snoop response.
+        - Shared: other caches return a HIT snoop response, so the write
+          must also invalidate the line in the other caches.
 
         Requires the following sequence:
         - Read line (cache miss)
         - Write same line (cache hit)
         """
-        # Event 0: Read miss at self.nohit_addr (gets line in E state)
-        handle_event(self.cache, TraceCommand.L1_DATA_READ, self.nohit_addr)
-
-        # Confirm the L2 sendline message was issued for L1 request
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"l2: (sendline|2).*")
-
-        self.check_line_state(self.nohit_addr, MESIState.EXCLUSIVE)
-
-        # Event 1: Write hit at self.nohit_addr (should move to M state)
-        handle_event(self.cache, self.trace_event, self.nohit_addr)
-        self.check_line_state(self.nohit_addr, MESIState.MODIFIED)
-
-        # The second read event should not generate a bus operation, because
-        # it was a hit to an exclusive line. So we'll test that there's only
-        # been 1 of these bus operations issued in total.
-        self.assert_log_called_once_with(LogLevel.NORMAL, r".*busop.*(read|1).*")
-
-        # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 1)
-        self.assertEqual(self.cache.statistics.cache_writes, 1)
-        self.assertEqual(self.cache.statistics.cache_hits, 1)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        for state, script, invalidates in (
+            (MESIState.EXCLUSIVE, self._EXCLUSIVE_SCRIPT, 0),
+            (MESIState.SHARED, self._SHARED_SCRIPT, 1),
+        ):
+            with self.subTest(state=state.name):
+                self.reset_subtest()
+
+                self.run_script(script, self.script_ops)
+
+                # Confirm the L2 sendline message was issued for each L1 request,
+                # and only the first read request resulted in a READ bus operation
+                self.assert_log_counts(
+                    LogLevel.NORMAL,
+                    (CacheMessage.SENDLINE, 2),
+                    (BusOp.READ, 1),
+                    (BusOp.INVALIDATE, invalidates),
+                )
+
+                # Assertions for statistics
+                # (reads, writes, hits, misses)
+                self.assertEqual(self.cache.statistics.as_tuple(), (1, 1, 1, 1))
 
     def test_modified(self):
         """
@@ -64,115 +80,59 @@ class TestCommandL1WriteRequest(IntegrationSetup):
         handle_event(self.cache, self.trace_event, self.nohit_addr)
 
         # Confirm the RWIM bus op was issued
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"busop.*(rwim|4).*")
+        self.assert_log_called_once_with(LogLevel.NORMAL, BusOp.RWIM)
 
         # Confirm the L2 sendline message was issued for L1 request
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"l2: (sendline|2).*")
+        self.assert_log_called_once_with(LogLevel.NORMAL, CacheMessage.SENDLINE)
 
         self.check_line_state(self.nohit_addr, MESIState.MODIFIED)
 
         # Event 1: Write hit at self.nohit_addr (should stay in M state)
-        handle_event(self.cache, self.trace_event, self.nohit_addr)
-        self.check_line_state(self.nohit_addr, MESIState.MODIFIED)
+        self.handle_and_check(self.trace_event, self.nohit_addr, MESIState.MODIFIED)
 
         # Confirm the L2 sendline message was issued for each L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 2)
+        self.assert_log_called_with_count(LogLevel.NORMAL, CacheMessage.SENDLINE, 2)
 
         # TODO: Decide whether or not we want to assert additional busops
         # have *not* been issued, or if this one is even of value.
-        self.assert_log_called_with_count(
-            LogLevel.NORMAL, r"busop.*(write|2).*address.*", 0
-        )
-
-        # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 0)
-        self.assertEqual(self.cache.statistics.cache_writes, 2)
-        self.assertEqual(self.cache.statistics.cache_hits, 1)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
-
-    def test_shared(self):
-        """
-        Test writing a line in the Shared state.
-        Other caches return a HIT snoop response.
-
-        Requires the following sequence:
-        - Read line (cache miss)
-        - Write line (cache hit)
-        """
-        # Event 0: Read miss at self.hit_addr (gets line in S state)
-        handle_event(self.cache, TraceCommand.L1_DATA_READ, self.hit_addr)
-        self.check_line_state(self.hit_addr, MESIState.SHARED)
-
-        # Event 1: Write hit at self.hit_addr (should move to M state)
-        handle_event(self.cache, self.trace_event, self.hit_addr)
-        self.check_line_state(self.hit_addr, MESIState.MODIFIED)
-
-        # Confirm the INVALIDATE bus op was issued
-        self.assert_log_called_with_count(
-            LogLevel.NORMAL, r"busop.*(invalidate|3).*", 1
-        )
-
-        # Confirm the L2 sendline message was issued for each L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 2)
-
-        # Only the first read request should have resulted in a READ bus operation.
-        self.assert_log_called_once_with(LogLevel.NORMAL, r".*busop.*(read|1).*address")
+        self.assert_log_called_with_count(LogLevel.NORMAL, BusOp.WRITE, 0)
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 1)
-        self.assertEqual(self.cache.statistics.cache_writes, 1)
-        self.assertEqual(self.cache.statistics.cache_hits, 1)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (0, 2, 1, 1))
 
-    def test_hitm(self):
+    def test_write_miss(self):
         """
-        Test writing a line that's been modified in another cache.
-        Other caches return a HITM snoop response.
+        Test writing a line that's valid in another cache, run as one subtest per
+        snoop response:
+        - HIT: the line is in a S or E state in another cache.
+        - HITM: the line has been modified in another cache. Assumes the cache
+          with the modified line flushes the line (with write-back) and our
+          cache snarfs it.
 
         Requires the following sequence:
-        - Write line (cache miss, snarf from other cache flushWB)
-        """
-        # Event 1: Write miss at self.hitm_addr (gets line in M state)
-        # Assumes cache with the modified line flushes the line
-        # (with write-back) and our cache snarfs it
-        handle_event(self.cache, self.trace_event, self.hitm_addr)
-        self.check_line_state(self.hitm_addr, MESIState.MODIFIED)
-
-        # Confirm the L2 sendline message was issued for L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 1)
-
-        # Confirm the RWIM bus op was issued
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"busop.*(rwim|4).*")
-
-        # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 0)
-        self.assertEqual(self.cache.statistics.cache_writes, 1)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
-
-    def test_hit(self):
-        """
-        Test writing a line that's in a S or E state in another cache.
-        Other cache(s) return a HIT snoop response.
-
-        Requires the following sequence:
-        - Write line (cache hit)
+        - Write line (cache miss)
         """
-        # Event 1: Write hit at self.hit_addr (should move to M state)
-        handle_event(self.cache, self.trace_event, self.hit_addr)
-        self.check_line_state(self.hit_addr, MESIState.MODIFIED)
-
-        # Confirm the L2 sendline message was issued for L1 request
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 1)
-
-        # Confirm the RWIM bus op was issued
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"busop.*(rwim|4).*")
-
-        # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 0)
-        self.assertEqual(self.cache.statistics.cache_writes, 1)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        for snoop_result in ("hit", "hitm"):
+            with self.subTest(snoop_result=snoop_result):
+                self.reset_subtest()
+
+                # Write miss (gets line in M state)
+                self.run_script(
+                    (("write", snoop_result, MESIState.MODIFIED),), self.script_ops
+                )
+
+                # Confirm the L2 sendline message was issued for L1 request,
+                # and the RWIM bus op was issued
+                self.assert_log_counts(
+                    LogLevel.NORMAL,
+                    (CacheMessage.SENDLINE, 1),
+                    (BusOp.RWIM, 1),
+                )
+
+                # Assertions for statistics
+                # (reads, writes, hits, misses)
+                self.assertEqual(self.cache.statistics.as_tuple(), (0, 1, 0, 1))
 
     def test_clean_eviction(self):
         """
@@ -183,35 +143,29 @@ class TestCommandL1WriteRequest(IntegrationSetup):
         - Read lines to fill the cache (cache misses)
         - Write line to cause an eviction (cache miss)
         """
-        # Base addr that returns a NOHIT snoop response from other caches
-        address = 0x00000002  # Start with set 0, offset with NOHIT response
-        increment = 0x100000  # 1 MiB increment to change the tag
-
         # Fill the cache
-        for _i in range(16):
-            address += increment
-            handle_event(self.cache, TraceCommand.L1_DATA_READ, address)
-            self.check_line_state(address, MESIState.EXCLUSIVE)
+        handle_events(
+            self.cache, TraceCommand.L1_DATA_READ, self.eviction_addresses[:16]
+        )
+        self.check_line_states(self.eviction_addresses[:16], MESIState.EXCLUSIVE)
 
         # One write to trigger an eviction of a clean line
-        handle_event(self.cache, self.trace_event, address + increment)
-
-        # Confirm the L2 sendline message was issued for each L1 request (reads and write)
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 17)
-
-        # Check for one READ bus operation per cache miss
-        self.assert_log_called_with_count(
-            LogLevel.NORMAL, r".*busop.*(read|1).*address", 16
+        handle_event(self.cache, self.trace_event, self.eviction_addresses[16])
+
+        # Confirm the L2 sendline message was issued for each L1 request (reads and write),
+        # one READ bus operation per read miss, a RWIM bus operation for the write miss,
+        # and the L2 message to L1 for evictline
+        self.assert_log_counts(
+            LogLevel.NORMAL,
+            (CacheMessage.SENDLINE, 17),
+            (BusOp.READ, 16),
+            (BusOp.RWIM, 1),
+            (CacheMessage.EVICTLINE, 1),
         )
 
-        # Confirm the L2 message to L1 for evictline was issued
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (evictline|4).*", 1)
-
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 16)
-        self.assertEqual(self.cache.statistics.cache_writes, 1)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 17)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (16, 1, 0, 17))
 
     def test_dirty_eviction(self):
         """
@@ -222,36 +176,28 @@ class TestCommandL1WriteRequest(IntegrationSetup):
         - Write lines to fill the cache (cache misses)
         - Write line to cause an eviction (cache miss)
         """
-        # Base addr that returns a NOHIT snoop response from other caches
-        address = 0x00000002  # Start with set 0, offset with NOHIT response
-        increment = 0x100000  # 1 MiB increment to change the tag
-
         # Fill the cache
-        for _i in range(16):
-            address += increment
-            handle_event(self.cache, 1, address)
-            self.check_line_state(address, MESIState.MODIFIED)
+        handle_events(
+            self.cache, TraceCommand.L1_DATA_WRITE, self.eviction_addresses[:16]
+        )
+        self.check_line_states(self.eviction_addresses[:16], MESIState.MODIFIED)
 
         # One write to trigger an eviction of a clean line
-        handle_event(self.cache, self.trace_event, address + increment)
-
-        # Confirm the L2 sendline message was issued for each L1 request (reads and write)
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (sendline|2).*", 17)
-
-        # Check for one READ bus operation per cache miss
-        self.assert_log_called_with_count(
-            LogLevel.NORMAL, r".*busop.*(rwim|4).*address", 17
+        handle_event(self.cache, self.trace_event, self.eviction_addresses[16])
+
+        # Confirm the L2 sendline message was issued for each L1 request, one RWIM
+        # bus operation per cache miss, and the L2 messages to L1 for eviction
+        self.assert_log_counts(
+            LogLevel.NORMAL,
+            (CacheMessage.SENDLINE, 17),
+            (BusOp.RWIM, 17),
+            (CacheMessage.GETLINE, 1),
+            (CacheMessage.EVICTLINE, 1),
         )
 
-        # Confirm the L2 messages to L1 for eviction were issued
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (getline|1).*", 1)
-        self.assert_log_called_with_count(LogLevel.NORMAL, r"l2: (evictline|4).*", 1)
-
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 0)
-        self.assertEqual(self.cache.statistics.cache_writes, 17)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 17)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (0, 17, 0, 17))
 
 
 # Allow direct execution of this file
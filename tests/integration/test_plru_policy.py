@@ -1,19 +1,28 @@
 import unittest
 from common.constants import MESIState, TraceCommand
-from utils.event_handler import handle_event
+from utils.event_handler import handle_event, handle_events
 from tests.integration.integration_setup import IntegrationSetup
 
 
 class TestPLRUPolicy(IntegrationSetup):
 
-    def setUp(self):
-        super().setUp()
+    # Create an address to use in order to cause an eviction in a
+    # full set populated with the single_set_addresses fixture
+    # The addresses in single_set_addresses increment by 1 in the
+    # 20th bit, so all ones in the MSBs will be a different tag
+    new_tag_addr = (0xFFF << 20) | IntegrationSetup.single_set_addresses[0]
 
-        # Create an address to use in order to cause an eviction in a
-        # full set populated with the self.single_set_addresses fixture
-        # The addresses in single_set_addresses increment by 1 in the
-        # 20th bit, so all ones in the MSBs will be a different tag
-        self.new_tag_addr = (0xFFF << 20) | self.single_set_addresses[0]
+    def fill_set(self):
+        """
+        Read each address in the single_set_addresses fixture to fill all the ways
+        of one cache set, then check all of the lines were allocated in one pass.
+        """
+        # No PLRU test checks log messages, so don't record the fill's
+        with self.mock_logger.pause():
+            handle_events(
+                self.cache, TraceCommand.L1_DATA_READ, self.single_set_addresses
+            )
+        self.check_line_states(self.single_set_addresses, MESIState.EXCLUSIVE)
 
     def test_sequential_access(self):
         """
@@ -25,11 +34,8 @@ class TestPLRUPolicy(IntegrationSetup):
         - Read one more
         - Confirm the first line in the set has been evicted
         """
-        # Fill the cache set
-        for addr in self.single_set_addresses:
-            handle_event(self.cache, TraceCommand.L1_DATA_READ, addr)
-            # Confirm the lines were allocated
-            self.check_line_state(addr, MESIState.EXCLUSIVE)
+        # Fill the cache set, then confirm the lines were allocated
+        self.fill_set()
 
         handle_event(self.cache, TraceCommand.L1_DATA_READ, self.new_tag_addr)
 
@@ -52,21 +58,12 @@ class TestPLRUPolicy(IntegrationSetup):
         - Read one more
         - Confirm that way 8 has been evicted
         """
-        # Fill the cache set
-        for addr in self.single_set_addresses:
-            handle_event(self.cache, TraceCommand.L1_DATA_READ, addr)
-            # Confirm the lines were allocated
-            self.check_line_state(addr, MESIState.EXCLUSIVE)
+        # Fill the cache set, then confirm the lines were allocated
+        self.fill_set()
 
         # Access ways 0, 1, and 2
-        handle_event(
-            self.cache, TraceCommand.L1_DATA_READ, self.single_set_addresses[0]
-        )
-        handle_event(
-            self.cache, TraceCommand.L1_DATA_READ, self.single_set_addresses[1]
-        )
-        handle_event(
-            self.cache, TraceCommand.L1_DATA_READ, self.single_set_addresses[2]
+        handle_events(
+            self.cache, TraceCommand.L1_DATA_READ, self.single_set_addresses[0:3]
         )
 
         # Read a new item in, causing an eviction
@@ -89,18 +86,14 @@ class TestPLRUPolicy(IntegrationSetup):
         - Read one more
         - Confirm the way 12 has been evicted
         """
-        # Fill the cache set
-        for addr in self.single_set_addresses:
-            handle_event(self.cache, TraceCommand.L1_DATA_READ, addr)
-            # Confirm the lines were allocated
-            self.check_line_state(addr, MESIState.EXCLUSIVE)
+        # Fill the cache set, then confirm the lines were allocated
+        self.fill_set()
 
         # Access way 8 then way 2
-        handle_event(
-            self.cache, TraceCommand.L1_DATA_READ, self.single_set_addresses[8]
-        )
-        handle_event(
-            self.cache, TraceCommand.L1_DATA_READ, self.single_set_addresses[2]
+        handle_events(
+            self.cache,
+            TraceCommand.L1_DATA_READ,
+            (self.single_set_addresses[8], self.single_set_addresses[2]),
         )
 
         # Read a new item in, causing an eviction
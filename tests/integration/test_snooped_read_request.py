@@ -1,5 +1,12 @@
 import unittest
-from common.constants import MESIState, LogLevel, TraceCommand
+from common.constants import (
+    BusOp,
+    CacheMessage,
+    LogLevel,
+    MESIState,
+    SnoopResult,
+    TraceCommand,
+)
 from utils.event_handler import handle_event
 from tests.integration.integration_setup import IntegrationSetup
 
@@ -33,14 +40,12 @@ class TestSnoopedReadRequest(IntegrationSetup):
         handle_event(self.cache, self.trace_event, self.nohit_addr)
 
         # Confirm our cache put the snoop result on the bus and updated state
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"snoopresult.*(hit|1)")
+        self.assert_log_called_once_with(LogLevel.NORMAL, SnoopResult.HIT)
         self.check_line_state(self.nohit_addr, MESIState.SHARED)
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 1)
-        self.assertEqual(self.cache.statistics.cache_writes, 0)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (1, 0, 0, 1))
 
     def test_modified(self):
         """
@@ -58,21 +63,17 @@ class TestSnoopedReadRequest(IntegrationSetup):
         handle_event(self.cache, self.trace_event, self.nohit_addr)
 
         # Confirm our cache put the snoop result on the bus and updated state
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"snoopresult.*(hitm|2)")
+        self.assert_log_called_once_with(LogLevel.NORMAL, SnoopResult.HITM)
         self.check_line_state(self.nohit_addr, MESIState.SHARED)
 
         # Confirm our cache retrieved the line from L1 and wrote it back
         # We assume the reading cache can snarf it
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"l2: (getline|1).*")
-        self.assert_log_called_once_with(
-            LogLevel.NORMAL, r"busop.*(write|2).*address.*"
-        )
+        self.assert_log_called_once_with(LogLevel.NORMAL, CacheMessage.GETLINE)
+        self.assert_log_called_once_with(LogLevel.NORMAL, BusOp.WRITE)
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 0)
-        self.assertEqual(self.cache.statistics.cache_writes, 1)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (0, 1, 0, 1))
 
     def test_shared(self):
         """
@@ -90,14 +91,12 @@ class TestSnoopedReadRequest(IntegrationSetup):
         handle_event(self.cache, self.trace_event, self.nohit_addr)
 
         # Confirm our cache put the snoop result on the bus and stayed in S state
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"snoopresult.*(hit|1)")
+        self.assert_log_called_once_with(LogLevel.NORMAL, SnoopResult.HIT)
         self.check_line_state(self.nohit_addr, MESIState.SHARED)
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 1)
-        self.assertEqual(self.cache.statistics.cache_writes, 0)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 1)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (1, 0, 0, 1))
 
     def test_invalid(self):
         """
@@ -113,14 +112,12 @@ class TestSnoopedReadRequest(IntegrationSetup):
         handle_event(self.cache, self.trace_event, self.hit_addr)
 
         # Confirm our cache put the snoop result on the bus and stayed in I state
-        self.assert_log_called_once_with(LogLevel.NORMAL, r"snoopresult.*(nohit|0)")
+        self.assert_log_called_once_with(LogLevel.NORMAL, SnoopResult.NOHIT)
         self.check_line_state(self.nohit_addr, MESIState.INVALID)
 
         # Assertions for statistics
-        self.assertEqual(self.cache.statistics.cache_reads, 0)
-        self.assertEqual(self.cache.statistics.cache_writes, 0)
-        self.assertEqual(self.cache.statistics.cache_hits, 0)
-        self.assertEqual(self.cache.statistics.cache_misses, 0)
+        # (reads, writes, hits, misses)
+        self.assertEqual(self.cache.statistics.as_tuple(), (0, 0, 0, 0))
 
 
 # Allow direct execution of this file
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from io import StringIO
 
@@ -5,41 +7,83 @@ from common.constants import BusOp, CacheMessage, LogLevel, SnoopResult
 from utils.cache_logger import CacheLogger, log_operation
 
 
-class TestCacheLogger(unittest.TestCase):
-    def setUp(self):
-        # Create string buffers to capture output
-        self.stdout = StringIO()
-        self.stderr = StringIO()
-        self.logger = CacheLogger(
-            level=LogLevel.DEBUG, stdout=self.stdout, stderr=self.stderr
-        )
+class _ActiveLogger:
+    """
+    Forwards log calls to a logger that can be swapped between tests, so the
+    operations of DummyCache only need to be decorated once, at import.
+    """
 
-    def tearDown(self):
-        self.stdout.close()
-        self.stderr.close()
+    __slots__ = ("target",)
 
-    def create_dummy_cache_with_logger(self, logger):
-        class DummyCache:
-            @log_operation(logger=logger)  # Will be set in tests
-            def BusOperation(
-                self, bus_op: int, address: int, snoop_result: int
-            ) -> None:
-                return None
+    def __init__(self):
+        self.target = None
+
+    def log(self, level: LogLevel, message: str, *args):
+        self.target.log(level, message, *args)
+
+
+_active_logger = _ActiveLogger()
+
+# The demonstration tests write to the console and to files, rather than checking
+# any behavior, so they only run when requested
+run_demo_tests = unittest.skipUnless(
+    os.environ.get("RUN_DEMO_TESTS") == "1", "set RUN_DEMO_TESTS=1 to run demos"
+)
 
-            @log_operation(logger=logger)
-            def GetSnoopResult(self, address: int) -> int:
-                return SnoopResult.HIT
 
-            @log_operation(logger=logger)
-            def PutSnoopResult(self, address: int, snoop_result: int) -> None:
-                return None
+class DummyCache:
+    @log_operation(logger=_active_logger)
+    def BusOperation(self, bus_op: int, address: int, snoop_result: int) -> None:
+        return None
+
+    @log_operation(logger=_active_logger)
+    def GetSnoopResult(self, address: int) -> int:
+        return SnoopResult.HIT
+
+    @log_operation(logger=_active_logger)
+    def PutSnoopResult(self, address: int, snoop_result: int) -> None:
+        return None
+
+    @log_operation(logger=_active_logger)
+    def MessageToCache(self, message: int, address: int) -> None:
+        return None
+
+
+class TestCacheLogger(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Create string buffers to capture output, and a logger writing to them,
+        # shared by all tests in the class
+        cls.stdout = StringIO()
+        cls.stderr = StringIO()
+        cls.logger = CacheLogger(
+            level=LogLevel.DEBUG, stdout=cls.stdout, stderr=cls.stderr
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stdout.close()
+        cls.stderr.close()
 
-            @log_operation(logger=logger)
-            def MessageToCache(self, message: int, address: int) -> None:
-                return None
+    def setUp(self):
+        # Empty the shared buffers in place, so each test starts with no output
+        for buffer in (self.stdout, self.stderr):
+            buffer.seek(0)
+            buffer.truncate()
 
+    def create_dummy_cache_with_logger(self, logger):
+        # Route the shared DummyCache's logging to this test's logger
+        _active_logger.target = logger
         return DummyCache()
 
+    def assert_contains_all(self, stream_name, output, expected):
+        """Assert that each expected string is in a stream's output, reporting all that are missing at once"""
+        missing = [text for text in expected if text not in output]
+        if missing:
+            self.fail(
+                f"Missing from {stream_name}: {missing!r}\n{stream_name} output: {output!r}"
+            )
+
     def test_logging_levels(self):
         """Test that different logging levels work correctly"""
         # Test SILENT level
@@ -65,6 +109,21 @@ class TestCacheLogger(unittest.TestCase):
         self.assertIn("Normal message", normal_logger.stderr.getvalue())
         self.assertNotIn("Debug message", normal_logger.stderr.getvalue())
 
+    def test_deferred_formatting(self):
+        """Test that format args are only applied when the level is enabled"""
+
+        class Unformattable:
+            def __str__(self):
+                raise AssertionError("Message below logger level was formatted")
+
+        normal_logger = CacheLogger(
+            level=LogLevel.NORMAL, stdout=StringIO(), stderr=StringIO()
+        )
+        normal_logger.log(LogLevel.NORMAL, "Address: %x, Op: %s", 0x1234, "READ")
+        normal_logger.log(LogLevel.DEBUG, "Debug message %s", Unformattable())
+
+        self.assertEqual("Address: 1234, Op: READ\n", normal_logger.stderr.getvalue())
+
     def test_bus_operation_logging(self):
         """Test logging of bus operations"""
         dummy = self.create_dummy_cache_with_logger(self.logger)
@@ -72,10 +131,11 @@ class TestCacheLogger(unittest.TestCase):
         # Test bus operation
         dummy.BusOperation(BusOp.READ, 0x1234, SnoopResult.NOHIT)
 
-        stderr_output = self.stderr.getvalue()
-        self.assertIn("BusOp: READ", stderr_output)
-        self.assertIn("Address: 1234", stderr_output)
-        self.assertIn("Snoop Result: NOHIT", stderr_output)
+        self.assert_contains_all(
+            "stderr",
+            self.stderr.getvalue(),
+            ["BusOp: READ", "Address: 1234", "Snoop Result: NOHIT"],
+        )
 
     def test_snoop_result_logging(self):
         """Test logging of snoop results"""
@@ -83,9 +143,11 @@ class TestCacheLogger(unittest.TestCase):
 
         # Test get snoop result
         dummy.GetSnoopResult(0x5678)
-        stderr_output = self.stderr.getvalue()
-        self.assertIn("GetSnoopResult: Address 5678", stderr_output)
-        self.assertIn("Snoop Result: HIT", stderr_output)
+        self.assert_contains_all(
+            "stderr",
+            self.stderr.getvalue(),
+            ["GetSnoopResult: Address 5678", "Snoop Result: HIT"],
+        )
 
         # Clear buffer
         self.stderr.seek(0)
@@ -93,9 +155,11 @@ class TestCacheLogger(unittest.TestCase):
 
         # Test put snoop result
         dummy.PutSnoopResult(0x9ABC, SnoopResult.NOHIT)
-        stderr_output = self.stderr.getvalue()
-        self.assertIn("SnoopResult: Address 9abc", stderr_output)
-        self.assertIn("SnoopResult: NOHIT", stderr_output)
+        self.assert_contains_all(
+            "stderr",
+            self.stderr.getvalue(),
+            ["SnoopResult: Address 9abc", "SnoopResult: NOHIT"],
+        )
 
     def test_message_to_cache_logging(self):
         """Test logging of cache messages"""
@@ -105,6 +169,7 @@ class TestCacheLogger(unittest.TestCase):
         stderr_output = self.stderr.getvalue()
         self.assertIn("L2: INVALIDATELINE def0", stderr_output)
 
+    @run_demo_tests
     def test_logger_output_demonstration(self):
         """Demonstration test that shows actual logger output"""
         # Create a logger that writes to both StringIO (for assertions) and console
@@ -134,47 +199,47 @@ class TestCacheLogger(unittest.TestCase):
 
         print("\n=== End Logger Output Demonstration ===")
 
+    @run_demo_tests
     def test_file_logging(self):
-        """Demonstration of logging to files. Creates debug.log and stats.log in the
-        tests/utils directory."""
-        import os
-
-        # Get the directory where the test file is located
-        test_dir = os.path.dirname(os.path.abspath(__file__))
-        print(f"\nCreating log files in: {test_dir}")
-
-        # Specify files with full paths
-        debug_path = os.path.join(test_dir, "debug.log")
-        stats_path = os.path.join(test_dir, "stats.log")
-
-        try:
-            # Open files for writing
-            with open(debug_path, "w") as debug_file, open(
-                stats_path, "w"
-            ) as stats_file:
-                file_logger = CacheLogger(
-                    level=LogLevel.DEBUG, stdout=stats_file, stderr=debug_file
-                )
-
-                # Create dummy cache with this logger
-                dummy = self.create_dummy_cache_with_logger(file_logger)
-
-                # Perform various operations
-                dummy.BusOperation(BusOp.READ, 0x1234, SnoopResult.NOHIT)
-                dummy.GetSnoopResult(0x5678)
-                dummy.PutSnoopResult(0x9ABC, SnoopResult.NOHIT)
-                dummy.MessageToCache(CacheMessage.INVALIDATELINE, 0xDEF0)
-
-                # Ensure everything is written
-                debug_file.flush()
-                stats_file.flush()
-
-            print("\nLog files have been created at:")
-            print(f"Debug log: {debug_path}")
-            print(f"Stats log: {stats_path}")
-
-        except Exception as e:
-            print(f"Error during file operations: {str(e)}")
+        """Demonstration of logging to files. Creates debug.log and stats.log in a
+        temporary directory, and prints their contents before it is removed."""
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            print(f"\nCreating log files in: {log_dir}")
+
+            # Specify files with full paths
+            debug_path = os.path.join(log_dir, "debug.log")
+            stats_path = os.path.join(log_dir, "stats.log")
+
+            try:
+                # Open files for writing
+                with open(debug_path, "w") as debug_file, open(
+                    stats_path, "w"
+                ) as stats_file:
+                    file_logger = CacheLogger(
+                        level=LogLevel.DEBUG, stdout=stats_file, stderr=debug_file
+                    )
+
+                    # Create dummy cache with this logger
+                    dummy = self.create_dummy_cache_with_logger(file_logger)
+
+                    # Perform various operations
+                    dummy.BusOperation(BusOp.READ, 0x1234, SnoopResult.NOHIT)
+                    dummy.GetSnoopResult(0x5678)
+                    dummy.PutSnoopResult(0x9ABC, SnoopResult.NOHIT)
+                    dummy.MessageToCache(CacheMessage.INVALIDATELINE, 0xDEF0)
+
+                    # Ensure everything is written
+                    debug_file.flush()
+                    stats_file.flush()
+
+                # Show the log files, since the directory is removed afterwards
+                for path in (debug_path, stats_path):
+                    with open(path) as log_file:
+                        print(f"\n{path}:\n{log_file.read()}")
+
+            except Exception as e:
+                print(f"Error during file operations: {str(e)}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from cache.cache import Cache
 from config.cache_config import CacheConfig
 from common.constants import BusOp
-from utils.event_handler import handle_event
+from utils.event_handler import handle_event, handle_events
 
 
 class TestEventHandler(unittest.TestCase):
@@ -12,34 +12,51 @@ class TestEventHandler(unittest.TestCase):
     Tests that the appropriate cache methods are called for each event opcode.
     """
 
-    def setUp(self):
-        cache_config = CacheConfig()
-
+    # Cache methods that handle_event() dispatches to
+    MOCKED_CACHE_METHODS = (
+        "pr_read",
+        "pr_write",
+        "handle_snoop",
+        "clear_cache",
+        "print_cache",
+    )
+
+    @classmethod
+    def setUpClass(cls):
         # Mocking the config logger and args for testing
-        self.mock_logger = MagicMock()
-        self.mock_args = MagicMock(silent=False, debug=True)
-
-        self.cache = Cache(cache_config, self.mock_logger)
-
-        # Replace cache methods with MagicMocks
-        self.cache.pr_read = MagicMock()
-        self.cache.pr_write = MagicMock()
-        self.cache.handle_snoop = MagicMock()
-        self.cache.clear_cache = MagicMock()
-        self.cache.print_cache = MagicMock()
-
-        # Patch the config logger and args
-        patch(
-            "config.project_config.config.get_logger", return_value=self.mock_logger
-        ).start()
-        patch(
-            "config.project_config.config.get_args", return_value=self.mock_args
+        cls.mock_logger = MagicMock()
+        cls.mock_args = MagicMock(silent=False, debug=True)
+
+        # Patch the config logger and args once for all tests in the class
+        patch.multiple(
+            "config.project_config.config",
+            get_logger=MagicMock(return_value=cls.mock_logger),
+            get_args=MagicMock(return_value=cls.mock_args),
         ).start()
 
-    def tearDown(self):
-        # Stop any patches done during the test
+        # The cache's own state is never touched, since its methods are mocked,
+        # so a single instance is shared by all tests in the class
+        cls.cache = Cache(CacheConfig(), cls.mock_logger)
+
+        # Replace cache methods with MagicMocks, which shadow the class methods
+        # on the shared instance. They are created once and reset before each test.
+        cls.cache_method_mocks = []
+        for name in cls.MOCKED_CACHE_METHODS:
+            method_mock = MagicMock()
+            setattr(cls.cache, name, method_mock)
+            cls.cache_method_mocks.append(method_mock)
+
+    @classmethod
+    def tearDownClass(cls):
+        # Stop the patches started for the class
         patch.stopall()
 
+    def setUp(self):
+        # Clear any calls recorded on the logger and cache methods by a previous test
+        self.mock_logger.reset_mock()
+        for method_mock in self.cache_method_mocks:
+            method_mock.reset_mock()
+
     def test_handle_event_with_pr_read(self):
         """Test that handle_event appropriately calls cache.pr_read()."""
 
@@ -124,6 +141,54 @@ class TestEventHandler(unittest.TestCase):
         self.cache.handle_snoop.assert_not_called()
         self.cache.clear_cache.assert_not_called()
 
+    def test_handle_events_with_pr_read(self):
+        """Test that handle_events calls cache.pr_read() once per address, in order."""
+        addrs = [0x1000, 0x2000, 0x3000]
+        handle_events(self.cache, 0, addrs)
+
+        # Assert pr_read was called for each address in order, and for no others
+        self.cache.pr_read.assert_has_calls([call(addr) for addr in addrs])
+        self.assertEqual(self.cache.pr_read.call_count, len(addrs))
+
+        # Ensure other methods are not called
+        self.cache.pr_write.assert_not_called()
+        self.cache.handle_snoop.assert_not_called()
+
+    def test_handle_events_with_pr_write(self):
+        """Test that handle_events calls cache.pr_write() once per address, in order."""
+        addrs = [0x4000, 0x5000, 0x6000]
+        handle_events(self.cache, 1, addrs)
+
+        # Assert pr_write was called for each address in order, and for no others
+        self.cache.pr_write.assert_has_calls([call(addr) for addr in addrs])
+        self.assertEqual(self.cache.pr_write.call_count, len(addrs))
+
+        # Ensure other methods are not called
+        self.cache.pr_read.assert_not_called()
+        self.cache.handle_snoop.assert_not_called()
+
+    def test_handle_events_with_handle_snoop(self):
+        """Test that handle_events falls back to handle_event() for snoops."""
+        addrs = [0x1000, 0x2000]
+        with patch(
+            "utils.event_handler.handle_event", wraps=handle_event
+        ) as handle_event_mock:
+            handle_events(self.cache, 6, addrs)
+
+        # Assert each address was routed through handle_event() in order
+        handle_event_mock.assert_has_calls(
+            [call(self.cache, 6, addr) for addr in addrs]
+        )
+        self.assertEqual(handle_event_mock.call_count, len(addrs))
+
+        # Assert handle_snoop was called with the bus op for each address
+        self.cache.handle_snoop.assert_has_calls(
+            [call(BusOp.INVALIDATE, addr) for addr in addrs]
+        )
+        self.assertEqual(self.cache.handle_snoop.call_count, len(addrs))
+        self.cache.pr_read.assert_not_called()
+        self.cache.pr_write.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()